@@ -37,6 +37,13 @@ app.add_middleware(
 from middleware.apikey_mapper import APIKeyMapperMiddleware
 app.add_middleware(APIKeyMapperMiddleware)
 
+
+@app.on_event("startup")
+async def load_apikey_index():
+    # Parse the key mappings up front so the first sk- request doesn't pay for
+    # it; the middleware re-reads the files only when their mtime changes
+    APIKeyMapperMiddleware.load_index()
+
 # Add middleware to handle double slashes in URLs
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -4,32 +4,32 @@ Chat2API CLI - Professional, modern interface
 """
 import sys
 import json
-import asyncio
+import base64
+import atexit
 import os
 import secrets
-import string
-import webbrowser
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict
-import httpx
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
-from rich.markdown import Markdown
 from rich import box
-from rich.layout import Layout
 from rich.text import Text
 from rich.align import Align
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.syntax import Syntax
-from rich.columns import Columns
-from rich.rule import Rule
-from rich.live import Live
-from rich.status import Status
-from prompt_toolkit import prompt as pt_prompt
-from prompt_toolkit.completion import Completer, Completion
-from prompt_toolkit.formatted_text import HTML
+
+# Heavier modules (httpx, asyncio, prompt_toolkit, rich.status, webbrowser)
+# are imported inside the functions that need them to keep startup fast.
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class Theme:
     """Retro pixelated theme for the CLI"""
@@ -73,6 +73,30 @@ console = Console(
     theme=rich_theme
 )
 
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+def _atomic_write_json(path: Path, obj):
+    """Write JSON to a temp file in one call and rename it over the target"""
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_bytes(_json_dumps(obj))
+    os.replace(tmp, path)
+
+def _json_body(obj) -> bytes:
+    """Serialize a compact JSON request body, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
 def get_data_dir():
     """Get the appropriate data directory based on execution context"""
     if getattr(sys, 'frozen', False):
@@ -87,12 +111,76 @@ def normalize_endpoint(endpoint: str) -> str:
         return endpoint.rstrip('/')
     return endpoint
 
+@lru_cache(maxsize=None)
+def get_http_client():
+    """Shared keep-alive HTTP client for sync and health-check requests"""
+    import httpx
+
+    client = httpx.Client(timeout=10)
+    atexit.register(client.close)
+    return client
+
+@lru_cache(maxsize=None)
+def get_sync_executor():
+    """Single worker that pushes token and API key syncs off the UI thread"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Create the shared client first: atexit runs LIFO, so pending syncs
+    # finish before the client is closed and their results are printed after
+    get_http_client()
+    atexit.register(print_sync_messages)
+    # A single worker keeps full-snapshot syncs in order; the server merges
+    # them, so a stale snapshot landing last could undo a newer change
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sync")
+    atexit.register(executor.shutdown, wait=True)
+    return executor
+
+_async_client = None
+_async_client_loop = None
+
+def get_async_client():
+    """Pooled AsyncClient for chat requests, reused while the event loop lives"""
+    global _async_client, _async_client_loop
+    import asyncio
+    import httpx
+
+    # Pooled connections belong to the loop that opened them
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        _async_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+        )
+        _async_client_loop = loop
+    return _async_client
+
+async def close_async_client():
+    """Close the pooled AsyncClient; must run on the loop that created it"""
+    global _async_client, _async_client_loop
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+        _async_client_loop = None
+
 CONFIG_DIR = get_data_dir()
 CONFIG_FILE = CONFIG_DIR / "config.json"
 TOKENS_FILE = CONFIG_DIR / "tokens.json"
 APIKEYS_FILE = CONFIG_DIR / "apikeys.json"
 DATA_DIR = CONFIG_DIR / "data"
 
+# Token syncs requested within this window are coalesced into one POST
+SYNC_DEBOUNCE_SECONDS = 0.5
+
+# Status lines from background syncs. Printing them from the worker thread
+# would draw over the prompt the user is typing in, so they are queued here
+# and shown by the main thread before the next prompt.
+_sync_messages = deque()
+
+def print_sync_messages():
+    """Print status lines queued by background syncs"""
+    while _sync_messages:
+        console.print(_sync_messages.popleft())
+
 class Config:
     """CLI Configuration Manager"""
     def __init__(self):
@@ -100,18 +188,46 @@ class Config:
         self.config_file = CONFIG_FILE
         self.tokens_file = TOKENS_FILE
         self.apikeys_file = APIKEYS_FILE
+        self._dir_ready = False
+        self._pending_sync_tokens = threading.Event()
+        self._sync_timer = None
+        self._sync_lock = threading.Lock()
+        self._sync_flush_registered = False
+        self._existing_files = self._scan_config_dir()
         self.config = self.load_config()
         self.tokens = self.load_tokens()
         self.apikeys = self.load_apikeys()
 
+        # Resolved once here and refreshed by set(); normalize_endpoint has
+        # already been applied by load_config/set
+        self.endpoint = self.config.get("api_endpoint", "http://localhost:5005")
+
+        # load_tokens/load_apikeys only ever return dicts; the rest of the
+        # class relies on this instead of re-checking on every call
+        assert isinstance(self.tokens, dict)
+        assert isinstance(self.apikeys, dict)
+
+    def _scan_config_dir(self) -> set:
+        """List the config directory once instead of stat-ing each file"""
+        try:
+            with os.scandir(self.config_dir) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return set()
+
+    def _ensure_config_dir(self):
+        """Create the config directory on first save only"""
+        if not self._dir_ready:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+
     def load_config(self) -> dict:
         """Load configuration from file"""
-        if self.config_file.exists():
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
-                if "api_endpoint" in config_data:
-                    config_data["api_endpoint"] = normalize_endpoint(config_data["api_endpoint"])
-                return config_data
+        if self.config_file.name in self._existing_files:
+            config_data = _json_loads(self.config_file.read_bytes())
+            if "api_endpoint" in config_data:
+                config_data["api_endpoint"] = normalize_endpoint(config_data["api_endpoint"])
+            return config_data
         return {
             "api_endpoint": "http://localhost:5005",
             "default_model": "gpt-3.5-turbo",
@@ -120,29 +236,26 @@ class Config:
 
     def load_tokens(self) -> dict:
         """Load labeled tokens"""
-        if self.tokens_file.exists():
+        if self.tokens_file.name in self._existing_files:
             try:
-                with open(self.tokens_file, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        return data
-                    else:
-                        return {}
+                data = _json_loads(self.tokens_file.read_bytes())
+                if isinstance(data, dict):
+                    return data
+                else:
+                    return {}
             except (json.JSONDecodeError, Exception):
                 return {}
         return {}
 
     def save_config(self):
         """Save configuration to file"""
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        self._ensure_config_dir()
+        _atomic_write_json(self.config_file, self.config)
 
     def save_tokens(self):
         """Save tokens to file"""
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.tokens_file, 'w') as f:
-            json.dump(self.tokens, f, indent=2)
+        self._ensure_config_dir()
+        _atomic_write_json(self.tokens_file, self.tokens)
 
     def get(self, key: str, default=None):
         return self.config.get(key, default)
@@ -151,28 +264,28 @@ class Config:
         if key == "api_endpoint" and value:
             value = normalize_endpoint(value)
         self.config[key] = value
+        if key == "api_endpoint":
+            self.endpoint = self.config.get("api_endpoint", "http://localhost:5005")
         self.save_config()
 
     def add_token(self, name: str, token: str, sync_to_server=True):
         """Add a labeled token"""
-        if not isinstance(self.tokens, dict):
-            self.tokens = {}
-        
-        self.tokens[name] = token
+        self.add_tokens({name: token}, sync_to_server=sync_to_server)
+
+    def add_tokens(self, items: Dict[str, str], sync_to_server=True):
+        """Add several labeled tokens with a single save, append and sync"""
+        self.tokens.update(items)
         self.save_tokens()
         DATA_DIR.mkdir(exist_ok=True)
         token_file = DATA_DIR / "token.txt"
         with open(token_file, 'a') as f:
-            f.write(f"{token}\n")
+            f.writelines(f"{token}\n" for token in items.values())
         
         if sync_to_server:
             self.sync_tokens_to_server()
 
     def remove_token(self, name: str):
         """Remove a labeled token"""
-        if not isinstance(self.tokens, dict):
-            self.tokens = {}
-            
         if name in self.tokens:
             del self.tokens[name]
             self.save_tokens()
@@ -181,9 +294,6 @@ class Config:
 
     def use_token(self, name: str):
         """Set active token by name"""
-        if not isinstance(self.tokens, dict):
-            self.tokens = {}
-            
         if name in self.tokens:
             self.config['active_token'] = name
             self.save_config()
@@ -192,47 +302,47 @@ class Config:
 
     def get_active_token(self):
         """Get the currently active token"""
-        if not isinstance(self.tokens, dict):
-            self.tokens = {}
-
         active = self.config.get('active_token')
         if active and active in self.tokens:
             return self.tokens[active]
         if self.tokens:
-            return list(self.tokens.values())[0]
+            return next(iter(self.tokens.values()))
         return None
 
     def load_apikeys(self) -> dict:
         """Load generated API keys"""
-        if self.apikeys_file.exists():
+        if self.apikeys_file.name in self._existing_files:
             try:
-                with open(self.apikeys_file, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        return data
-                    else:
-                        return {}
+                data = _json_loads(self.apikeys_file.read_bytes())
+                if isinstance(data, dict):
+                    return data
+                else:
+                    return {}
             except (json.JSONDecodeError, Exception):
                 return {}
         return {}
 
     def save_apikeys(self):
         """Save API keys to file"""
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.apikeys_file, 'w') as f:
-            json.dump(self.apikeys, f, indent=2)
+        self._ensure_config_dir()
+        _atomic_write_json(self.apikeys_file, self.apikeys)
+
+    def save_all(self):
+        """Save config, tokens and API keys together"""
+        self._ensure_config_dir()
+        _atomic_write_json(self.config_file, self.config)
+        _atomic_write_json(self.tokens_file, self.tokens)
+        _atomic_write_json(self.apikeys_file, self.apikeys)
 
     def generate_apikey(self, name: str, sync_to_server=True) -> str:
         """Generate a new OpenAI-compatible API key"""
-        if not isinstance(self.apikeys, dict):
-            self.apikeys = {}
-
-        random_part = ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(48))
+        # 30 random bytes -> exactly 48 base32 characters, all [a-z2-7]
+        random_part = base64.b32encode(secrets.token_bytes(30)).decode().lower()
         api_key = f"sk-{random_part}"
 
         self.apikeys[name] = {
             "key": api_key,
-            "created": __import__('datetime').datetime.now().isoformat(),
+            "created": datetime.now(timezone.utc).isoformat(timespec='seconds'),
             "token_name": self.config.get('active_token', 'auto')
         }
         self.save_apikeys()
@@ -244,9 +354,6 @@ class Config:
 
     def remove_apikey(self, name: str):
         """Remove an API key"""
-        if not isinstance(self.apikeys, dict):
-            self.apikeys = {}
-
         if name in self.apikeys:
             del self.apikeys[name]
             self.save_apikeys()
@@ -254,100 +361,155 @@ class Config:
         return False
 
     def sync_tokens_to_server(self):
-        """Sync local tokens to server"""
-        endpoint = self.get("api_endpoint", "http://localhost:5005")
-        
-        if endpoint == "http://localhost:5005":
+        """Schedule a debounced sync of local tokens to server"""
+        if self.endpoint == "http://localhost:5005":
             return False
         
-        try:
-            import requests
+        with self._sync_lock:
+            if not self._sync_flush_registered:
+                # Create the executor (and client) first: atexit runs LIFO,
+                # so the final flush happens before the client is closed.
+                # By then the executor has already finished in-flight syncs,
+                # so that flush posts directly, after them.
+                get_sync_executor()
+                atexit.register(self._flush_sync_tokens, background=False)
+                self._sync_flush_registered = True
             
+            self._pending_sync_tokens.set()
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+            self._sync_timer = threading.Timer(SYNC_DEBOUNCE_SECONDS, self._flush_sync_tokens)
+            self._sync_timer.daemon = True
+            self._sync_timer.start()
+        return True
+
+    def _flush_sync_tokens(self, background: bool = True):
+        """Send the current tokens if a sync is pending"""
+        with self._sync_lock:
+            if not self._pending_sync_tokens.is_set():
+                return False
+            self._pending_sync_tokens.clear()
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            # Snapshot the dict so later edits can't race the POST
+            endpoint, tokens = self.endpoint, dict(self.tokens)
+        if not background:
+            return self._do_sync_tokens(endpoint, tokens)
+        # Share the single sync worker with API keys so snapshots reach the
+        # server in order; it merges them, so an older one landing last
+        # would restore a replaced token
+        try:
+            get_sync_executor().submit(self._do_sync_tokens, endpoint, tokens)
+        except RuntimeError:
+            # Timer fired after the executor shut down for exit; leave it to
+            # the atexit flush on the main thread
+            self._pending_sync_tokens.set()
+            return False
+        return True
+
+    def _do_sync_tokens(self, endpoint: str, tokens: dict):
+        """POST tokens to the server's /admin/sync/tokens endpoint"""
+        try:
             tokens_data = {
-                "tokens": self.tokens,
+                "tokens": tokens,
                 "sync_type": "tokens"
             }
             
-            response = requests.post(
+            response = get_http_client().post(
                 f"{endpoint}/admin/sync/tokens",
-                json=tokens_data,
-                timeout=10
+                json=tokens_data
             )
             
             if response.status_code == 200:
-                console.print("[dim green]✓ Tokens synced to server[/dim green]")
+                _sync_messages.append("[dim green]✓ Tokens synced to server[/dim green]")
                 return True
             else:
-                console.print(f"[dim yellow]⚠ Sync failed: {response.status_code}[/dim yellow]")
+                _sync_messages.append(f"[dim yellow]⚠ Sync failed: {response.status_code}[/dim yellow]")
                 return False
                 
         except Exception as e:
-            console.print(f"[dim red]✗ Sync error: {str(e)}[/dim red]")
+            _sync_messages.append(f"[dim red]✗ Sync error: {str(e)}[/dim red]")
             return False
 
     def sync_apikeys_to_server(self):
-        endpoint = self.get("api_endpoint", "http://localhost:5005")
+        """Sync local API keys to server in the background"""
+        endpoint = self.endpoint
         
         if endpoint == "http://localhost:5005":
-            return False
+            return None
         
+        # Snapshot the dict so later edits can't race the worker thread
+        return get_sync_executor().submit(self._do_sync_apikeys, endpoint, dict(self.apikeys))
+
+    def _do_sync_apikeys(self, endpoint: str, apikeys: dict):
+        """POST apikeys to the server's /admin/sync/apikeys endpoint"""
         try:
-            import requests
-            
             apikeys_data = {
-                "apikeys": self.apikeys,
+                "apikeys": apikeys,
                 "sync_type": "apikeys"
             }
             
-            response = requests.post(
+            response = get_http_client().post(
                 f"{endpoint}/admin/sync/apikeys",
-                json=apikeys_data,
-                timeout=10
+                json=apikeys_data
             )
             
             if response.status_code == 200:
-                console.print("[dim green]✓ API keys synced to server[/dim green]")
+                _sync_messages.append("[dim green]✓ API keys synced to server[/dim green]")
                 return True
             else:
-                console.print(f"[dim yellow]⚠ Sync failed: {response.status_code}[/dim yellow]")
+                _sync_messages.append(f"[dim yellow]⚠ Sync failed: {response.status_code}[/dim yellow]")
                 return False
                 
         except Exception as e:
-            console.print(f"[dim red]✗ Sync error: {str(e)}[/dim red]")
+            _sync_messages.append(f"[dim red]✗ Sync error: {str(e)}[/dim red]")
             return False
 
 config = Config()
 
+def read_last_line(path: Path, chunk_size: int = 8192) -> str:
+    """Return the last non-blank line of a file, reading backwards from the end"""
+    with open(path, 'rb') as f:
+        offset = f.seek(0, os.SEEK_END)
+        tail = b""
+        while offset > 0:
+            step = min(chunk_size, offset)
+            offset -= step
+            f.seek(offset)
+            tail = f.read(step) + tail
+            # Stop once a newline precedes the last line's content
+            if b"\n" in tail.rstrip():
+                break
+    lines = tail.strip().splitlines()
+    return lines[-1].decode(errors='ignore').strip() if lines else ""
+
 def setup_auto_config():
     """Auto-configure CLI by reading from tokens.json"""
     if not config.tokens:
         project_tokens_file = Path("tokens.json")
         if project_tokens_file.exists():
             try:
-                with open(project_tokens_file, 'r') as f:
-                    project_tokens = json.load(f)
-                    if isinstance(project_tokens, dict) and project_tokens:
-                        for name, token in project_tokens.items():
-                            config.add_token(name, token)
-                        
-                        first_token_name = list(project_tokens.keys())[0]
-                        config.use_token(first_token_name)
-                        console.print(f"[dim]✓ Auto-configured with token '{first_token_name}' from tokens.json[/dim]")
-                        return True
+                project_tokens = _json_loads(project_tokens_file.read_bytes())
+                if isinstance(project_tokens, dict) and project_tokens:
+                    config.add_tokens(project_tokens)
+                    
+                    first_token_name = next(iter(project_tokens))
+                    config.use_token(first_token_name)
+                    console.print(f"[dim]✓ Auto-configured with token '{first_token_name}' from tokens.json[/dim]")
+                    return True
             except (json.JSONDecodeError, Exception) as e:
                 console.print(f"[dim yellow]⚠ Could not load tokens.json: {e}[/dim yellow]")
         
         data_token_file = Path("data/token.txt")
         if data_token_file.exists():
             try:
-                with open(data_token_file, 'r') as f:
-                    lines = f.read().strip().split('\n')
-                    if lines and lines[0].strip():
-                        token = lines[-1].strip()
-                        config.add_token("auto", token)
-                        config.use_token("auto")
-                        console.print("[dim]✓ Auto-configured with token from data/token.txt[/dim]")
-                        return True
+                token = read_last_line(data_token_file)
+                if token:
+                    config.add_token("auto", token)
+                    config.use_token("auto")
+                    console.print("[dim]✓ Auto-configured with token from data/token.txt[/dim]")
+                    return True
             except Exception as e:
                 console.print(f"[dim yellow]⚠ Could not load data/token.txt: {e}[/dim yellow]")
     
@@ -378,31 +540,48 @@ COMMANDS = {
     "/exit": "Exit the CLI",
 }
 
-class CommandCompleter(Completer):
-    """Custom completer for slash commands with descriptions"""
+@lru_cache(maxsize=None)
+def get_command_completer():
+    """Build the slash-command completer (prompt_toolkit is imported on first use)"""
+    from prompt_toolkit.completion import Completer, Completion
+    from prompt_toolkit.formatted_text import HTML
+
+    # COMMANDS is static: sort, lowercase and build the display meta once
+    # (simple white text for better readability)
+    commands = [
+        (cmd.lower(), cmd, HTML(f'<ansibrightwhite>{desc}</ansibrightwhite>'))
+        for cmd, desc in sorted(COMMANDS.items())
+    ]
 
-    def get_completions(self, document, complete_event):
-        text = document.text
+    class CommandCompleter(Completer):
+        """Custom completer for slash commands with descriptions"""
 
-        # Only show completions if text starts with /
-        if not text.startswith('/'):
-            return
+        def get_completions(self, document, complete_event):
+            text = document.text
 
-        # Get matching commands - iterate over items properly
-        for cmd, desc in sorted(COMMANDS.items()):
-            if cmd.lower().startswith(text.lower()):
-                # Simple white text for better readability
-                display_meta = HTML(f'<ansibrightwhite>{desc}</ansibrightwhite>')
-                yield Completion(
-                    cmd,
-                    start_position=-len(text),
-                    display_meta=display_meta
-                )
+            # Only show completions if text starts with /
+            if not text.startswith('/'):
+                return
+
+            lowered = text.lower()
+            start_position = -len(text)
+            for lower_cmd, cmd, display_meta in commands:
+                if lower_cmd.startswith(lowered):
+                    yield Completion(
+                        cmd,
+                        start_position=start_position,
+                        display_meta=display_meta
+                    )
+
+    return CommandCompleter()
 
 def get_user_input():
     """Get user input with retro styling and command completion"""
+    from prompt_toolkit import prompt as pt_prompt
+    from prompt_toolkit.formatted_text import HTML
+
     try:
-        completer = CommandCompleter()
+        completer = get_command_completer()
         result = pt_prompt(
             HTML('<ansibrightmagenta>></ansibrightmagenta> '),
             completer=completer,
@@ -413,47 +592,41 @@ def get_user_input():
     except (KeyboardInterrupt, EOFError):
         raise
 
+_BANNER_BORDER = "══════════════════════════════════════════════════════════════════════════════"
+_BANNER_BLANK = "                                                                              "
+
+# CHAT2API with gradient effect (using different purple shades)
+_BANNER_LINES = [
+    (f"╔{_BANNER_BORDER}╗", "#a855f7"),
+    (f"║{_BANNER_BLANK}║", "#9333ea"),
+    ("║    ██████╗██╗  ██╗ █████╗ ████████╗██████╗  █████╗ ██████╗ ██╗               ║", "#a855f7"),
+    ("║   ██╔════╝██║  ██║██╔══██╗╚══██╔══╝╚════██╗██╔══██╗██╔══██╗██║               ║", "#9333ea"),
+    ("║   ██║     ███████║███████║   ██║    █████╔╝███████║██████╔╝██║               ║", "#7c3aed"),
+    ("║   ██║     ██╔══██║██╔══██║   ██║   ██╔═══╝ ██╔══██║██╔═══╝ ██║               ║", "#6d28d9"),
+    ("║   ╚██████╗██║  ██║██║  ██║   ██║   ███████╗██║  ██║██║     ██║               ║", "#5b21b6"),
+    ("║    ╚═════╝╚═╝  ╚═╝╚═╝  ╚═╝   ╚═╝   ╚══════╝╚═╝  ╚═╝╚═╝     ╚═╝               ║", "#4c1d95"),
+    (f"║{_BANNER_BLANK}║", "#7c3aed"),
+    (f"╚{_BANNER_BORDER}╝", "#6d28d9"),
+]
+
+# The banner is static, so build the renderable once and reprint it
+_BANNER = Group(
+    Text(""),
+    *[Align.center(Text(line, style=color)) for line, color in _BANNER_LINES],
+    Text(""),
+    Align.center(Text.from_markup("[bold white]OpenAI-Compatible API Gateway[/bold white]")),
+    Align.center(Text.from_markup("[dim]Transform ChatGPT into powerful APIs[/dim]")),
+    Text(""),
+)
+
 def show_banner():
     """Show retro pixelated banner"""
-    # Clear screen for better presentation
-    os.system('cls' if os.name == 'nt' else 'clear')
-
-    # Create gradient purple effect for CHAT2API
-    console.print()
-    
-    # Top border with gradient
-    console.print(Align.center("╔══════════════════════════════════════════════════════════════════════════════╗"), style="#a855f7")
-    console.print(Align.center("║                                                                              ║"), style="#9333ea")
-    
-    # CHAT2API with gradient effect (using different purple shades)
-    chat2api_lines = [
-        "    ██████╗██╗  ██╗ █████╗ ████████╗██████╗  █████╗ ██████╗ ██╗               ",
-        "   ██╔════╝██║  ██║██╔══██╗╚══██╔══╝╚════██╗██╔══██╗██╔══██╗██║               ",
-        "   ██║     ███████║███████║   ██║    █████╔╝███████║██████╔╝██║               ",
-        "   ██║     ██╔══██║██╔══██║   ██║   ██╔═══╝ ██╔══██║██╔═══╝ ██║               ",
-        "   ╚██████╗██║  ██║██║  ██║   ██║   ███████╗██║  ██║██║     ██║               ",
-        "    ╚═════╝╚═╝  ╚═╝╚═╝  ╚═╝   ╚═╝   ╚══════╝╚═╝  ╚═╝╚═╝     ╚═╝               "
-    ]
-    
-    # Apply gradient effect to each line
-    gradient_colors = ["#a855f7", "#9333ea", "#7c3aed", "#6d28d9", "#5b21b6", "#4c1d95"]
-    
-    for i, line in enumerate(chat2api_lines):
-        color = gradient_colors[i % len(gradient_colors)]
-        console.print(Align.center(f"║{line}║"), style=color)
-    
-    console.print(Align.center("║                                                                              ║"), style="#7c3aed")
-    console.print(Align.center("╚══════════════════════════════════════════════════════════════════════════════╝"), style="#6d28d9")
-    console.print()
-    console.print(Align.center("[bold white]OpenAI-Compatible API Gateway[/bold white]"))
-    console.print(Align.center("[dim]Transform ChatGPT into powerful APIs[/dim]"))
-    console.print()
+    # Clear screen for better presentation (plain ANSI, no subprocess)
+    console.clear()
 
-def show_help():
-    """Show available commands with professional formatting"""
-    console.print()
+    console.print(_BANNER)
 
-    help_content = """
+_HELP_CONTENT = """
 [bold
   [bold
   [bold
@@ -485,27 +658,31 @@ def show_help():
 [dim][bold]Quick Start:[/bold] Type normally to chat with AI. Commands start with /[/dim]
 [dim][bold]Examples:[/bold] /use gpt-4, /token add, /apikey generate, /web[/dim]
     """
-    
-    help_panel = Panel(
-        help_content,
-        title="[bold white]Command Reference[/bold white]",
-        subtitle="[dim]Professional Chat2API CLI[/dim]",
-        border_style="#a855f7",
-        padding=(1, 2),
-        title_align="left"
-    )
-    
-    console.print(Align.center(help_panel))
+
+_HELP_PANEL = Panel(
+    _HELP_CONTENT,
+    title="[bold white]Command Reference[/bold white]",
+    subtitle="[dim]Professional Chat2API CLI[/dim]",
+    border_style="#a855f7",
+    padding=(1, 2),
+    title_align="left"
+)
+
+def show_help():
+    """Show available commands with professional formatting"""
+    console.print()
+    console.print(Align.center(_HELP_PANEL))
     console.print()
 
 def open_web_interface():
     """Open the ChatGPT web interface in the default browser"""
     console.print()
     
-    endpoint = config.get("api_endpoint", "http://localhost:5005")
+    endpoint = config.endpoint
     web_url = f"{endpoint}/"
     
     try:
+        import webbrowser
         webbrowser.open(web_url)
         
         success_panel = Panel(
@@ -558,15 +735,25 @@ def switch_endpoint(new_endpoint):
     # Test the new endpoint
     console.print(f"[dim]Testing endpoint: {new_endpoint}...[/dim]")
     
+    import httpx
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Probe /health and the /v1/models fallback concurrently so servers that
+    # answer 403 on /health cost one round trip instead of two
+    http = get_http_client()
+    pool = ThreadPoolExecutor(max_workers=2)
+    health_future = pool.submit(http.get, f"{new_endpoint}/health", timeout=5)
+    fallback_future = pool.submit(http.get, f"{new_endpoint}/v1/models", timeout=5)
+    pool.shutdown(wait=False)
+
     try:
-        import requests
         # Test with health endpoint first (doesn't require auth)
-        test_url = f"{new_endpoint}/health"
-        response = requests.get(test_url, timeout=5)
+        response = health_future.result()
         
         if response.status_code == 200:
             # Health endpoint is working, endpoint is valid
             config.set("api_endpoint", new_endpoint)
+            invalidate_health_cache()
             
             success_panel = Panel(
                 f"[bold green]✓ Endpoint switched successfully![/bold green]\n\n"
@@ -584,11 +771,11 @@ def switch_endpoint(new_endpoint):
         elif response.status_code == 403:
             # Try fallback test with /v1/models (403 is expected for Chat2API with RBAC)
             try:
-                fallback_url = f"{new_endpoint}/v1/models"
-                fallback_response = requests.get(fallback_url, timeout=5)
+                fallback_response = fallback_future.result()
                 if fallback_response.status_code == 403 and "RBAC" in fallback_response.text:
                     # This is a valid Chat2API server with RBAC enabled
                     config.set("api_endpoint", new_endpoint)
+                    invalidate_health_cache()
                     
                     success_panel = Panel(
                         f"[bold green]✓ Chat2API server detected![/bold green]\n\n"
@@ -636,7 +823,7 @@ def switch_endpoint(new_endpoint):
             console.print()
             return False
             
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         error_panel = Panel(
             f"[bold red]✗ Endpoint timeout![/bold red]\n\n"
             f"[bold]Endpoint:[/bold] [yellow]{new_endpoint}[/yellow]\n"
@@ -651,7 +838,7 @@ def switch_endpoint(new_endpoint):
         console.print()
         return False
         
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         error_panel = Panel(
             f"[bold red]✗ Connection failed![/bold red]\n\n"
             f"[bold]Endpoint:[/bold] [yellow]{new_endpoint}[/yellow]\n"
@@ -683,21 +870,34 @@ def switch_endpoint(new_endpoint):
         console.print()
         return False
 
+# (expiry, status_text, status_color) of the last /v1/models probe
+HEALTH_CACHE_TTL = 10.0
+_health_cache = (0.0, "", "")
+
+def invalidate_health_cache():
+    """Force the next show_status call to re-probe the server"""
+    global _health_cache
+    _health_cache = (0.0, "", "")
+
 def show_status(current_model, current_stream, conversation_history):
     """Show current status with retro design"""
     console.print()
 
-    endpoint = config.get("api_endpoint", "http://localhost:5005")
-    try:
-        import requests
-        response = requests.get(f"{endpoint}/v1/models", timeout=2)
-        status_icon = "●"
-        status_text = "ONLINE"
-        status_color = Theme.SUCCESS
-    except:
-        status_icon = "●"
-        status_text = "OFFLINE"
-        status_color = Theme.ERROR
+    global _health_cache
+
+    endpoint = config.endpoint
+    now = time.monotonic()
+    if now < _health_cache[0]:
+        _, status_text, status_color = _health_cache
+    else:
+        try:
+            response = get_http_client().get(f"{endpoint}/v1/models", timeout=2)
+            status_text = "ONLINE"
+            status_color = Theme.SUCCESS
+        except:
+            status_text = "OFFLINE"
+            status_color = Theme.ERROR
+        _health_cache = (now + HEALTH_CACHE_TTL, status_text, status_color)
 
     console.print(Align.center("╔══════════════════════════════════════════════════════════════════════════════╗"), style="#a855f7")
     console.print(Align.center("║                                Server Status                                 ║"), style="#9333ea")
@@ -713,33 +913,30 @@ def show_status(current_model, current_stream, conversation_history):
     console.print(Align.center(f"Type [{Theme.ACCENT_PURPLE}]/help[/{Theme.ACCENT_PURPLE}] for commands"))
     console.print()
 
-def list_models():
-    """Show available models with professional formatting"""
-    models = [
-        # GPT-3.5 Models
-        ("gpt-3.5-turbo", "Fast & Efficient", "Best for quick questions and general use", Theme.ACCENT_GREEN),
-        # GPT-4 Models
-        ("gpt-4", "Advanced Reasoning", "Best for complex tasks and analysis", Theme.ACCENT_BLUE),
-        ("gpt-4-mobile", "Mobile Optimized", "Optimized for mobile devices", Theme.ACCENT_BLUE),
-        ("gpt-4-gizmo", "Gizmo Integration", "GPT-4 with gizmo capabilities", Theme.ACCENT_BLUE),
-        # GPT-4o Models
-        ("gpt-4o", "Latest Generation", "Most advanced capabilities", Theme.ACCENT_YELLOW),
-        ("gpt-4o-mini", "Efficient GPT-4o", "Faster, cheaper GPT-4o variant", Theme.ACCENT_YELLOW),
-        ("gpt-4o-canmore", "Canmore Model", "Specialized GPT-4o variant", Theme.ACCENT_CYAN),
-        ("gpt-4.5o", "Enhanced GPT-4o", "Advanced GPT-4o variant", Theme.ACCENT_CYAN),
-        # GPT-5
-        ("gpt-5", "Next Generation", "Future AI capabilities", Theme.ACCENT_CYAN),
-        # O1 Models
-        ("o1-preview", "Reasoning Engine", "Advanced reasoning and problem solving", Theme.ACCENT_RED),
-        ("o1-mini", "Lightweight Reasoning", "Efficient reasoning capabilities", Theme.ACCENT_RED),
-        ("o1", "General Reasoning", "General purpose reasoning model", Theme.ACCENT_RED),
-        # Auto Selection
-        ("auto", "Auto Selection", "Automatically select best available model", Theme.ACCENT_PURPLE)
-    ]
-
-    console.print()
-    
-    # Create models table
+_MODELS = [
+    # GPT-3.5 Models
+    ("gpt-3.5-turbo", "Fast & Efficient", "Best for quick questions and general use", Theme.ACCENT_GREEN),
+    # GPT-4 Models
+    ("gpt-4", "Advanced Reasoning", "Best for complex tasks and analysis", Theme.ACCENT_BLUE),
+    ("gpt-4-mobile", "Mobile Optimized", "Optimized for mobile devices", Theme.ACCENT_BLUE),
+    ("gpt-4-gizmo", "Gizmo Integration", "GPT-4 with gizmo capabilities", Theme.ACCENT_BLUE),
+    # GPT-4o Models
+    ("gpt-4o", "Latest Generation", "Most advanced capabilities", Theme.ACCENT_YELLOW),
+    ("gpt-4o-mini", "Efficient GPT-4o", "Faster, cheaper GPT-4o variant", Theme.ACCENT_YELLOW),
+    ("gpt-4o-canmore", "Canmore Model", "Specialized GPT-4o variant", Theme.ACCENT_CYAN),
+    ("gpt-4.5o", "Enhanced GPT-4o", "Advanced GPT-4o variant", Theme.ACCENT_CYAN),
+    # GPT-5
+    ("gpt-5", "Next Generation", "Future AI capabilities", Theme.ACCENT_CYAN),
+    # O1 Models
+    ("o1-preview", "Reasoning Engine", "Advanced reasoning and problem solving", Theme.ACCENT_RED),
+    ("o1-mini", "Lightweight Reasoning", "Efficient reasoning capabilities", Theme.ACCENT_RED),
+    ("o1", "General Reasoning", "General purpose reasoning model", Theme.ACCENT_RED),
+    # Auto Selection
+    ("auto", "Auto Selection", "Automatically select best available model", Theme.ACCENT_PURPLE)
+]
+
+def _build_models_table():
+    """Build the static models table shown by /models"""
     models_table = Table(
         title="[bold white]Available AI Models[/bold white]",
         show_header=True,
@@ -754,52 +951,69 @@ def list_models():
     models_table.add_column("Best For", style="dim", width=30)
     models_table.add_column("Status", style="default", width=15)
 
-    for model, desc, use_case, color in models:
+    for model, desc, use_case, color in _MODELS:
         models_table.add_row(
             f"[{color}]{model}[/{color}]",
             desc,
             use_case,
             f"[{Theme.SUCCESS}]Available[/{Theme.SUCCESS}]"
         )
+    return models_table
+
+# The model list is static, so the table and usage panel are built once
+_MODELS_TABLE = _build_models_table()
+
+_MODELS_USAGE_PANEL = Panel(
+    "[bold]Usage:[/bold] [#a855f7]/use <model-name>[/#a855f7]\n"
+    "[bold]Example:[/bold] [#a855f7]/use gpt-4[/#a855f7]\n"
+    "[dim]Models are automatically selected based on your needs[/dim]",
+    title="[bold]Quick Switch[/bold]",
+    border_style="#9333ea",
+    padding=(1, 2)
+)
 
-    console.print(Align.left(models_table))
+def list_models():
+    """Show available models with professional formatting"""
     console.print()
-    
-    # Usage instructions
-    usage_panel = Panel(
-        "[bold]Usage:[/bold] [#a855f7]/use <model-name>[/#a855f7]\n"
-        "[bold]Example:[/bold] [#a855f7]/use gpt-4[/#a855f7]\n"
-        "[dim]Models are automatically selected based on your needs[/dim]",
-        title="[bold]Quick Switch[/bold]",
-        border_style="#9333ea",
-        padding=(1, 2)
-    )
-    console.print(Align.left(usage_panel))
+    console.print(Align.left(_MODELS_TABLE))
+    console.print()
+    console.print(Align.left(_MODELS_USAGE_PANEL))
     console.print()
 
+# Token classification used by list_tokens: (label, color) by index
+_JWT_PREFIX = "eyJhbGciOi"
+_FK_PREFIX = "fk-"
+_TOKEN_TYPES = (
+    ("JWT", Theme.ACCENT_BLUE),
+    ("FakeOpen", Theme.ACCENT_PURPLE),
+    ("Refresh", Theme.ACCENT_GREEN),
+    ("Unknown", Theme.ACCENT_YELLOW),
+)
+
+_NO_TOKENS_PANEL = Panel(
+    "[bold yellow]⚠ No access tokens configured[/bold yellow]\n\n"
+    "[dim]Add your first token with:[/dim] [bold #a855f7]/token add[/bold #a855f7]\n"
+    "[dim]Get tokens from:[/dim] [bold #a855f7]https://chatgpt.com[/bold #a855f7]",
+    title="[bold]No Tokens Found[/bold]",
+    border_style=Theme.WARNING,
+    padding=(1, 2)
+)
+
+@lru_cache(maxsize=64)
+def _styled(label: str, style: str) -> Text:
+    """Shared styled cell for fixed labels (statuses, token types); not for user data"""
+    return Text(label, style=style)
+
 def list_tokens():
     """List all saved tokens with professional formatting"""
-    if not isinstance(config.tokens, dict):
-        config.tokens = {}
-
     if not config.tokens:
         console.print()
-        empty_panel = Panel(
-            "[bold yellow]⚠ No access tokens configured[/bold yellow]\n\n"
-            "[dim]Add your first token with:[/dim] [bold #a855f7]/token add[/bold #a855f7]\n"
-            "[dim]Get tokens from:[/dim] [bold #a855f7]https://chatgpt.com[/bold #a855f7]",
-            title="[bold]No Tokens Found[/bold]",
-            border_style=Theme.WARNING,
-            padding=(1, 2)
-        )
-        console.print(empty_panel)
+        console.print(_NO_TOKENS_PANEL)
         console.print()
         return
 
     active = config.get('active_token')
 
-    console.print()
-    
     tokens_table = Table(
         title="[bold white]Access Tokens[/bold white]",
         show_header=True,
@@ -815,38 +1029,32 @@ def list_tokens():
     tokens_table.add_column("Status", style="default", width=15)
 
     for name, token in config.tokens.items():
-        if token.startswith("eyJhbGciOi"):
-            token_type = "JWT"
-            type_color = Theme.ACCENT_BLUE
-        elif token.startswith("fk-"):
-            token_type = "FakeOpen"
-            type_color = Theme.ACCENT_PURPLE
-        elif len(token) == 45:
-            token_type = "Refresh"
-            type_color = Theme.ACCENT_GREEN
+        idx = (0 if token[:2] == "ey" and token.startswith(_JWT_PREFIX)
+               else 1 if token.startswith(_FK_PREFIX)
+               else 2 if len(token) == 45
+               else 3)
+        token_type, type_color = _TOKEN_TYPES[idx]
+
+        if len(token) > 25:
+            preview = Text.assemble((token[:12], "dim"), ("...", "dim"), (token[-6:], "dim"))
         else:
-            token_type = "Unknown"
-            type_color = Theme.ACCENT_YELLOW
-
-        preview = f"{token[:12]}...{token[-6:]}" if len(token) > 25 else token
+            preview = Text(token, style="dim")
 
+        # Pre-styled Text cells skip Rich's markup parser on every row
         if name == active:
-            status = f"[{Theme.SUCCESS}]Active[/{Theme.SUCCESS}]"
-            name_style = f"[{Theme.SUCCESS}]{name}[/{Theme.SUCCESS}]"
+            status = _styled("Active", Theme.SUCCESS)
+            name_style = Text(name, style=Theme.SUCCESS)
         else:
-            status = "[dim]Inactive[/dim]"
-            name_style = name
+            status = _styled("Inactive", "dim")
+            name_style = Text(name)
 
         tokens_table.add_row(
             name_style,
-            f"[{type_color}]{token_type}[/{type_color}]",
+            _styled(token_type, type_color),
             preview,
             status
         )
 
-    console.print(Align.center(tokens_table))
-    console.print()
-    
     if active:
         active_info = f"[bold green]Active Token:[/bold green] [bold]{active}[/bold]"
     else:
@@ -862,22 +1070,38 @@ def list_tokens():
         border_style="#9333ea",
         padding=(1, 2)
     )
-    console.print(Align.center(management_panel))
-    console.print()
+    console.print(Group(
+        Text(""),
+        Align.center(tokens_table),
+        Text(""),
+        Align.center(management_panel),
+        Text(""),
+    ))
+
+_ADD_TOKEN_WELCOME_PANEL = Panel(
+    "[bold white]Add New Access Token[/bold white]\n\n"
+    "[dim]This will securely store your ChatGPT access token for use with the CLI.[/dim]",
+    title="[bold]Token Setup[/bold]",
+    border_style="#a855f7",
+    padding=(1, 2)
+)
+
+_INSTRUCTIONS_PANEL = Panel(
+    "[bold]How to get your access token:[/bold]\n\n"
+    "1. You can find it in [bold #a855f7]@https://chatgpt.com/api/auth/session[/bold #a855f7]\n"
+    "2. Copy the returned token value\n\n"
+    "[dim]The token should start with 'eyJ' or be a long string of characters.[/dim]",
+    title="[bold]Instructions[/bold]",
+    border_style="#9333ea",
+    padding=(1, 2)
+)
 
 def add_token_interactive():
     """Add a token with professional interactive prompts"""
     console.print()
     
     # Welcome panel
-    welcome_panel = Panel(
-        "[bold white]Add New Access Token[/bold white]\n\n"
-        "[dim]This will securely store your ChatGPT access token for use with the CLI.[/dim]",
-        title="[bold]Token Setup[/bold]",
-        border_style="#a855f7",
-        padding=(1, 2)
-    )
-    console.print(welcome_panel)
+    console.print(_ADD_TOKEN_WELCOME_PANEL)
     console.print()
 
     # Ask for name
@@ -891,26 +1115,13 @@ def add_token_interactive():
         console.print(f"[{Theme.ERROR}]✗ Name cannot be empty![/{Theme.ERROR}]")
         return
 
-    # Ensure tokens is a dictionary
-    if not isinstance(config.tokens, dict):
-        config.tokens = {}
-
     if name in config.tokens:
         if not Confirm.ask(f"[{Theme.WARNING}]⚠ Token '{name}' already exists. Replace it?[/{Theme.WARNING}]"):
             console.print("[dim]✗ Operation cancelled[/dim]")
             return
 
     # Instructions panel
-    instructions_panel = Panel(
-        "[bold]How to get your access token:[/bold]\n\n"
-        "1. You can find it in [bold #a855f7]@https://chatgpt.com/api/auth/session[/bold #a855f7]\n"
-        "2. Copy the returned token value\n\n"
-        "[dim]The token should start with 'eyJ' or be a long string of characters.[/dim]",
-        title="[bold]Instructions[/bold]",
-        border_style="#9333ea",
-        padding=(1, 2)
-    )
-    console.print(instructions_panel)
+    console.print(_INSTRUCTIONS_PANEL)
     console.print()
 
     # Ask for token
@@ -943,31 +1154,41 @@ def add_token_interactive():
 
     console.print()
 
+_MISSING_TOKEN_PANEL = Panel(
+    "[bold red]✗ No ChatGPT access token configured![/bold red]\n\n"
+    "[dim]You need to add a ChatGPT access token first before generating API keys.[/dim]\n"
+    "[bold]Add one with:[/bold] [cyan]/token add[/cyan]",
+    title="[bold]Missing Token[/bold]",
+    border_style=Theme.ERROR,
+    padding=(1, 2)
+)
+
+_APIKEY_WELCOME_PANEL = Panel(
+    "[bold white]Generate OpenAI-Compatible API Key[/bold white]\n\n"
+    "[dim]This creates a secure API key that external applications can use to access your ChatGPT account.[/dim]",
+    title="[bold]API Key Generator[/bold]",
+    border_style=Theme.PRIMARY,
+    padding=(1, 2)
+)
+
+_SECURITY_PANEL = Panel(
+    "[bold yellow]🔒 Security Note[/bold yellow]\n\n"
+    "[dim]This API key provides access to your ChatGPT account through this CLI.\n"
+    "Keep it secure and don't share it publicly. You can revoke it anytime by removing it.[/dim]",
+    border_style=Theme.WARNING,
+    padding=(1, 2)
+)
+
 def generate_apikey_interactive():
     """Generate a new API key for external programs with professional interface"""
     console.print()
 
     if not config.get_active_token():
-        error_panel = Panel(
-            "[bold red]✗ No ChatGPT access token configured![/bold red]\n\n"
-            "[dim]You need to add a ChatGPT access token first before generating API keys.[/dim]\n"
-            "[bold]Add one with:[/bold] [cyan]/token add[/cyan]",
-            title="[bold]Missing Token[/bold]",
-            border_style=Theme.ERROR,
-            padding=(1, 2)
-        )
-        console.print(error_panel)
+        console.print(_MISSING_TOKEN_PANEL)
         console.print()
         return
 
-    welcome_panel = Panel(
-        "[bold white]Generate OpenAI-Compatible API Key[/bold white]\n\n"
-        "[dim]This creates a secure API key that external applications can use to access your ChatGPT account.[/dim]",
-        title="[bold]API Key Generator[/bold]",
-        border_style=Theme.PRIMARY,
-        padding=(1, 2)
-    )
-    console.print(welcome_panel)
+    console.print(_APIKEY_WELCOME_PANEL)
     console.print()
 
     name = Prompt.ask(
@@ -980,16 +1201,13 @@ def generate_apikey_interactive():
         console.print(f"[{Theme.ERROR}]✗ Name cannot be empty![/{Theme.ERROR}]")
         return
 
-    if not isinstance(config.apikeys, dict):
-        config.apikeys = {}
-
     if name in config.apikeys:
         if not Confirm.ask(f"[{Theme.WARNING}]⚠ API key '{name}' already exists. Replace it?[/{Theme.WARNING}]"):
             console.print("[dim]✗ Operation cancelled[/dim]")
             return
 
     api_key = config.generate_apikey(name)
-    endpoint = config.get("api_endpoint", "http://localhost:5005")
+    endpoint = config.endpoint
 
     success_panel = Panel(
         f"[bold green]✓ API Key Generated Successfully![/bold green]\n\n"
@@ -1027,40 +1245,28 @@ def generate_apikey_interactive():
     console.print(examples_panel)
     console.print()
 
-    security_panel = Panel(
-        "[bold yellow]🔒 Security Note[/bold yellow]\n\n"
-        "[dim]This API key provides access to your ChatGPT account through this CLI.\n"
-        "Keep it secure and don't share it publicly. You can revoke it anytime by removing it.[/dim]",
-        border_style=Theme.WARNING,
-        padding=(1, 2)
-    )
-    console.print(security_panel)
+    console.print(_SECURITY_PANEL)
     console.print()
 
+_NO_APIKEYS_PANEL = Panel(
+    "[bold yellow]⚠ No API keys generated yet![/bold yellow]\n\n"
+    "[dim]Generate your first API key with:[/dim] [bold #a855f7]/apikey generate[/bold #a855f7]\n"
+    "[dim]API keys allow external applications to use your ChatGPT access.[/dim]",
+    title="[bold]No API Keys Found[/bold]",
+    border_style=Theme.WARNING,
+    padding=(1, 2)
+)
+
 def list_apikeys():
     """List all generated API keys with professional formatting"""
-    # Ensure apikeys is a dictionary
-    if not isinstance(config.apikeys, dict):
-        config.apikeys = {}
-
     if not config.apikeys:
         console.print()
-        empty_panel = Panel(
-            "[bold yellow]⚠ No API keys generated yet![/bold yellow]\n\n"
-            "[dim]Generate your first API key with:[/dim] [bold #a855f7]/apikey generate[/bold #a855f7]\n"
-            "[dim]API keys allow external applications to use your ChatGPT access.[/dim]",
-            title="[bold]No API Keys Found[/bold]",
-            border_style=Theme.WARNING,
-            padding=(1, 2)
-        )
-        console.print(empty_panel)
+        console.print(_NO_APIKEYS_PANEL)
         console.print()
         return
 
-    endpoint = config.get("api_endpoint", "http://localhost:5005")
+    endpoint = config.endpoint
 
-    console.print()
-    
     # Create API keys table
     apikeys_table = Table(
         title="[bold white]Generated API Keys[/bold white]",
@@ -1079,31 +1285,37 @@ def list_apikeys():
 
     for name, data in config.apikeys.items():
         api_key = data.get('key', '')
-        token_name = data.get('token_name', 'unknown')
-        created = data.get('created', 'unknown')
-
-        # Format created date
-        try:
-            from datetime import datetime
-            created_dt = datetime.fromisoformat(created)
-            created_str = created_dt.strftime("%m/%d %H:%M")
-        except:
-            created_str = created[:10] if len(created) > 10 else created
+        # Either may be null in apikeys.json (keys generated with no active
+        # token); Text() needs real strings
+        token_name = str(data.get('token_name', 'unknown'))
+        created = str(data.get('created', 'unknown'))
+
+        # Format created date. Naive local timestamps (older keys) are sliced
+        # directly; timezone-aware ones are parsed to convert to local time.
+        if len(created) in (19, 26) and created[10:11] == "T":
+            created_str = f"{created[5:7]}/{created[8:10]} {created[11:16]}"
+        else:
+            try:
+                created_dt = datetime.fromisoformat(created).astimezone()
+                created_str = created_dt.strftime("%m/%d %H:%M")
+            except:
+                created_str = created[:10] if len(created) > 10 else created
 
         # Show preview
-        preview = f"{api_key[:15]}...{api_key[-8:]}" if len(api_key) > 30 else api_key
+        if len(api_key) > 30:
+            preview = Text.assemble((api_key[:15], "dim"), ("...", "dim"), (api_key[-8:], "dim"))
+        else:
+            preview = Text(api_key, style="dim")
 
+        # Pre-styled Text cells skip Rich's markup parser on every row
         apikeys_table.add_row(
-            f"[{Theme.ACCENT_GREEN}]{name}[/{Theme.ACCENT_GREEN}]",
+            Text(name, style=Theme.ACCENT_GREEN),
             preview,
-            f"[{Theme.ACCENT_BLUE}]{token_name}[/{Theme.ACCENT_BLUE}]",
-            created_str,
-            f"[{Theme.SUCCESS}]✓ Active[/{Theme.SUCCESS}]"
+            Text(token_name, style=Theme.ACCENT_BLUE),
+            Text(created_str),
+            _styled("✓ Active", Theme.SUCCESS)
         )
 
-    console.print(apikeys_table)
-    console.print()
-    
     # Management panel
     management_panel = Panel(
         f"[bold]Base URL:[/bold] [magenta]{endpoint}/v1[/magenta]\n\n"
@@ -1115,8 +1327,13 @@ def list_apikeys():
         border_style=Theme.BORDER,
         padding=(1, 2)
     )
-    console.print(management_panel)
-    console.print()
+    console.print(Group(
+        Text(""),
+        apikeys_table,
+        Text(""),
+        management_panel,
+        Text(""),
+    ))
 
 def extract_actual_model(response_model: str, requested_model: str) -> str:
     """Extract the actual model being used from the response model field"""
@@ -1128,14 +1345,37 @@ def extract_actual_model(response_model: str, requested_model: str) -> str:
     
     return response_model
 
-async def verify_model(model: str) -> bool:
+# Response-model fragments accepted for each requested model that the server
+# may remap (e.g., gpt-4 -> gpt-4-0613)
+_MODEL_ALIAS_FRAGMENTS = frozenset({
+    "gpt-4-0613", "gpt-4-0125", "gpt-4-turbo", "gpt-4o", "gpt-5",
+    "gpt-3.5-turbo-0125", "gpt-3.5-turbo-1106",
+    "o1-preview", "o1-mini", "claude-3"
+})
+_MODEL_ALIASES = dict.fromkeys(
+    ("gpt-4", "gpt-4o", "gpt-4-turbo", "gpt-5", "gpt-3.5-turbo", "o1-preview", "o1-mini",
+     "claude-3-opus", "claude-3-sonnet", "claude-3-haiku"),
+    _MODEL_ALIAS_FRAGMENTS
+)
+
+# (endpoint, auth, model) combinations that verify_model has confirmed.
+# Failures are not cached so a transient error doesn't stick.
+_VERIFY_CACHE = set()
+
+async def verify_model(model: str, endpoint: Optional[str] = None, auth: Optional[str] = None) -> bool:
     """Verify that the specified model is actually being used by the server"""
-    endpoint = config.get("api_endpoint", "http://localhost:5005")
-    auth = config.get_active_token()
+    if endpoint is None:
+        endpoint = config.endpoint
+    if auth is None:
+        auth = config.get_active_token()
 
     if not auth:
         return False
 
+    cache_key = (endpoint, auth, model)
+    if cache_key in _VERIFY_CACHE:
+        return True
+
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {auth}"
@@ -1149,47 +1389,45 @@ async def verify_model(model: str) -> bool:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{endpoint}/v1/chat/completions",
-                headers=headers,
-                json=data
-            )
+        client = get_async_client()
+        response = await client.post(
+            f"{endpoint}/v1/chat/completions",
+            headers=headers,
+            json=data,
+            timeout=30.0
+        )
 
-            if response.status_code == 200:
-                result = response.json()
-                response_model = result.get("model", "")
-                
-                # Direct model verification - check if the server returned the correct model
-                if response_model:
-                    # Handle model mapping (e.g., gpt-4 -> gpt-4-0613)
-                    if (model in response_model or 
-                        response_model in model or
-                        any(mapped in response_model for mapped in [
-                            "gpt-4-0613", "gpt-4-0125", "gpt-4-turbo", "gpt-4o", "gpt-5",
-                            "gpt-3.5-turbo-0125", "gpt-3.5-turbo-1106",
-                            "o1-preview", "o1-mini", "claude-3"
-                        ] if model in ["gpt-4", "gpt-4o", "gpt-4-turbo", "gpt-5", "gpt-3.5-turbo", "o1-preview", "o1-mini", "claude-3-opus", "claude-3-sonnet", "claude-3-haiku"])):
-                        return True
-                
-                return False
-            else:
-                return False
+        if response.status_code == 200:
+            result = _json_loads(response.content)
+            response_model = result.get("model", "")
+            
+            # Direct model verification - check if the server returned the correct model
+            if response_model:
+                # Handle model mapping (e.g., gpt-4 -> gpt-4-0613)
+                accepted = _MODEL_ALIASES.get(model)
+                if (model in response_model or
+                    response_model in model or
+                    (accepted and any(alias in response_model for alias in accepted))):
+                    _VERIFY_CACHE.add(cache_key)
+                    return True
+            
+            return False
+        else:
+            return False
 
     except Exception:
         return False
 
-async def test_apikey(api_key_name: str, model: str):
+async def test_apikey(api_key_name: str, model: str, endpoint: Optional[str] = None):
     """Test a specific API key"""
+    import httpx
+
     console.print()
     console.print("╔════════════════════════════════════════════════════════════════════════╗", style="#a855f7")
     console.print("║                        [bold bright_white]TESTING API KEY[/bold bright_white]                                ║", style="#9333ea")
     console.print("╚════════════════════════════════════════════════════════════════════════╝", style="#7c3aed")
     console.print()
 
-    if not isinstance(config.apikeys, dict):
-        config.apikeys = {}
-
     if api_key_name not in config.apikeys:
         console.print(f"[bright_red]✗ API key '{api_key_name}' not found![/bright_red]")
         console.print("[dim bright_white]💡 List available keys with: [#a855f7]/apikey list[/#a855f7][/dim bright_white]")
@@ -1200,7 +1438,8 @@ async def test_apikey(api_key_name: str, model: str):
     api_key = api_key_data.get('key', '')
     token_name = api_key_data.get('token_name', 'unknown')
 
-    endpoint = config.get("api_endpoint", "http://localhost:5005")
+    if endpoint is None:
+        endpoint = config.endpoint
 
     console.print(f"[dim bright_white]🔑 Key Name:  [bright_yellow]{api_key_name}[/bright_yellow][/dim bright_white]")
     console.print(f"[dim bright_white]🎫 Token:     [bright_green]{token_name}[/bright_green][/dim bright_white]")
@@ -1222,37 +1461,38 @@ async def test_apikey(api_key_name: str, model: str):
     }
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{endpoint}/v1/chat/completions",
-                headers=headers,
-                json=data
-            )
+        client = get_async_client()
+        response = await client.post(
+            f"{endpoint}/v1/chat/completions",
+            headers=headers,
+            json=data,
+            timeout=30.0
+        )
 
-            if response.status_code == 200:
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
+        if response.status_code == 200:
+            result = _json_loads(response.content)
+            content = result["choices"][0]["message"]["content"]
 
-                console.print("==================================================================================", style="bright_green")
-                console.print("|                         [bold bright_white]✓ API KEY IS WORKING![/bold bright_white]                          |", style="bright_green")
-                console.print("==================================================================================", style="bright_green")
-                console.print()
-                console.print("[bright_white]Response from AI:[/bright_white]")
-                console.print(f"  [#a855f7]{content[:100]}{'...' if len(content) > 100 else ''}[/#a855f7]")
-                console.print()
-                console.print(f"[bright_green]✓ API key '[bright_yellow]{api_key_name}[/bright_yellow]' is working correctly![/bright_green]")
-                console.print()
-                console.print("[dim bright_white]You can now use this key in external applications:[/dim bright_white]")
-                console.print(f"  [dim bright_white]API Key:  [#a855f7]{api_key}[/#a855f7][/dim bright_white]")
-                console.print(f"  [dim bright_white]Base URL: [bright_magenta]{endpoint}/v1[/bright_magenta][/dim bright_white]")
-                console.print()
-                return True
-            else:
-                console.print(f"[bright_red]✗ Server error: Status {response.status_code}[/bright_red]")
-                error_detail = response.text[:300]
-                console.print(f"[dim]{error_detail}[/dim]")
-                console.print()
-                return False
+            console.print("==================================================================================", style="bright_green")
+            console.print("|                         [bold bright_white]✓ API KEY IS WORKING![/bold bright_white]                          |", style="bright_green")
+            console.print("==================================================================================", style="bright_green")
+            console.print()
+            console.print("[bright_white]Response from AI:[/bright_white]")
+            console.print(f"  [#a855f7]{content[:100]}{'...' if len(content) > 100 else ''}[/#a855f7]")
+            console.print()
+            console.print(f"[bright_green]✓ API key '[bright_yellow]{api_key_name}[/bright_yellow]' is working correctly![/bright_green]")
+            console.print()
+            console.print("[dim bright_white]You can now use this key in external applications:[/dim bright_white]")
+            console.print(f"  [dim bright_white]API Key:  [#a855f7]{api_key}[/#a855f7][/dim bright_white]")
+            console.print(f"  [dim bright_white]Base URL: [bright_magenta]{endpoint}/v1[/bright_magenta][/dim bright_white]")
+            console.print()
+            return True
+        else:
+            console.print(f"[bright_red]✗ Server error: Status {response.status_code}[/bright_red]")
+            error_detail = response.text[:300]
+            console.print(f"[dim]{error_detail}[/dim]")
+            console.print()
+            return False
 
     except httpx.ConnectError:
         console.print(f"[bright_red]✗ Cannot connect to server at {endpoint}[/bright_red]")
@@ -1264,105 +1504,83 @@ async def test_apikey(api_key_name: str, model: str):
         console.print()
         return False
 
-async def send_message(message: str, model: str, conversation_history: list, stream: bool):
+# Streamed text is flushed at the end of every network read, and every N
+# deltas within a single large read
+STREAM_FLUSH_CHUNKS = 8
+
+_SSE_DATA_PREFIX = b"data: "
+_SSE_DONE = b"[DONE]"
+
+_AUTH_REQUIRED_PANEL = Panel(
+    "[bold red]✗ No access token configured![/bold red]\n\n"
+    "[dim]You need to add a ChatGPT access token to use the chat feature.[/dim]\n"
+    "[bold]Add one with:[/bold] [#a855f7]/token add[/#a855f7]",
+    title="[bold]Authentication Required[/bold]",
+    border_style=Theme.ERROR,
+    padding=(1, 2)
+)
+
+def build_auth_headers(auth: str) -> dict:
+    """JSON request headers carrying the given bearer token"""
+    return {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {auth}"
+    }
+
+async def send_message(message: str, model: str, conversation_history: list, stream: bool,
+                       endpoint: Optional[str] = None, auth: Optional[str] = None,
+                       headers: Optional[dict] = None):
     """Send message to API with professional error handling and animations"""
-    endpoint = config.get("api_endpoint", "http://localhost:5005")
-    auth = config.get_active_token()
+    import httpx
+    from rich.status import Status
+
+    if endpoint is None:
+        endpoint = config.endpoint
+    if auth is None:
+        auth = config.get_active_token()
 
     if not auth:
-        error_panel = Panel(
-            "[bold red]✗ No access token configured![/bold red]\n\n"
-            "[dim]You need to add a ChatGPT access token to use the chat feature.[/dim]\n"
-            "[bold]Add one with:[/bold] [#a855f7]/token add[/#a855f7]",
-            title="[bold]Authentication Required[/bold]",
-            border_style=Theme.ERROR,
-            padding=(1, 2)
-        )
-        console.print(error_panel)
+        console.print(_AUTH_REQUIRED_PANEL)
         console.print()
         return None, model
 
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {auth}"
-    }
+    if headers is None:
+        headers = build_auth_headers(auth)
 
-    data = {
+    # Serialize the (possibly long) history ourselves rather than via
+    # httpx's stdlib-json encoder
+    body = _json_body({
         "model": model,
         "messages": conversation_history,
         "stream": stream
-    }
+    })
 
     try:
+        client = get_async_client()
         if stream:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                console.print()
-                
-                # Retro assistant header
-                console.print(f"[{Theme.ACCENT_GREEN}]AI[/{Theme.ACCENT_GREEN}] [white]▸[/white] ", end="")
-                
-                full_response = ""
-                actual_model = model  # Default to requested model
+            console.print()
+            
+            # Retro assistant header
+            console.print(f"[{Theme.ACCENT_GREEN}]AI[/{Theme.ACCENT_GREEN}] [white]▸[/white] ", end="")
+            
+            full_response_parts = []
+            actual_model = model  # Default to requested model
 
-                async with client.stream(
-                    "POST",
-                    f"{endpoint}/v1/chat/completions",
-                    headers=headers,
-                    json=data
-                ) as response:
-                    if response.status_code != 200:
-                        error_text = await response.aread()
-                        error_panel = Panel(
-                            f"[bold red]✗ Server Error {response.status_code}[/bold red]\n\n"
-                            f"[dim]{error_text.decode()[:200]}[/dim]",
-                            title="[bold]Request Failed[/bold]",
-                            border_style=Theme.ERROR,
-                            padding=(1, 2)
-                        )
-                        console.print(error_panel)
-                        return None, model
-
-                    async for chunk in response.aiter_lines():
-                        if chunk.startswith("data: "):
-                            chunk_data = chunk[6:]
-                            if chunk_data == "[DONE]":
-                                break
-
-                            try:
-                                json_chunk = json.loads(chunk_data)
-                                if "choices" in json_chunk and len(json_chunk["choices"]) > 0:
-                                    # Extract actual model from response
-                                    if "model" in json_chunk:
-                                        actual_model = extract_actual_model(json_chunk["model"], model)
-                                    
-                                    delta = json_chunk["choices"][0].get("delta", {})
-                                    content = delta.get("content", "")
-                                    if content:
-                                        console.print(content, end="")
-                                        full_response += content
-                            except json.JSONDecodeError:
-                                continue
-
-                console.print("\n")
-                return full_response, actual_model
-        else:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                # Professional loading animation
-                with Status(
-                    "[bold #a855f7]🤔 Processing your request...",
-                    spinner="dots",
-                    spinner_style=Theme.ACCENT_BLUE
-                ) as status:
-                    response = await client.post(
-                        f"{endpoint}/v1/chat/completions",
-                        headers=headers,
-                        json=data
-                    )
+            # Model text is written straight to stdout in batches rather than
+            # through one console.print per delta
+            buf = []
 
+            async with client.stream(
+                "POST",
+                f"{endpoint}/v1/chat/completions",
+                headers=headers,
+                content=body
+            ) as response:
                 if response.status_code != 200:
+                    error_text = await response.aread()
                     error_panel = Panel(
                         f"[bold red]✗ Server Error {response.status_code}[/bold red]\n\n"
-                        f"[dim]{response.text[:200]}[/dim]",
+                        f"[dim]{error_text.decode()[:200]}[/dim]",
                         title="[bold]Request Failed[/bold]",
                         border_style=Theme.ERROR,
                         padding=(1, 2)
@@ -1370,18 +1588,99 @@ async def send_message(message: str, model: str, conversation_history: list, str
                     console.print(error_panel)
                     return None, model
 
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
-                
-                # Extract actual model from response
-                actual_model = extract_actual_model(result.get("model", ""), model)
+                # Bind everything the per-chunk loop touches to locals
+                loads = _json_loads
+                write = sys.stdout.write
+                flush = sys.stdout.flush
+                buf_append = buf.append
+                append = full_response_parts.append
+                data_prefix = _SSE_DATA_PREFIX
+                prefix_len = len(data_prefix)
+                done_marker = _SSE_DONE
+
+                # Split SSE frames at the bytes level; only the JSON payload
+                # is ever decoded
+                pending = b""
+                done = False
+                async for raw in response.aiter_bytes():
+                    lines = (pending + raw).split(b"\n")
+                    pending = lines.pop()
+                    for line in lines:
+                        if not line.startswith(data_prefix):
+                            continue
+                        chunk_data = line[prefix_len:].rstrip(b"\r")
+                        if chunk_data == done_marker:
+                            done = True
+                            break
 
-                # Retro response display
-                console.print()
-                console.print(f"[{Theme.ACCENT_GREEN}]AI[/{Theme.ACCENT_GREEN}] [white]▸[/white] {content}")
-                console.print()
+                        try:
+                            json_chunk = loads(chunk_data)
+                        except ValueError:
+                            # Covers both json and orjson JSONDecodeError
+                            continue
+
+                        choices = json_chunk.get("choices")
+                        if choices:
+                            # Extract actual model from response
+                            if "model" in json_chunk:
+                                actual_model = extract_actual_model(json_chunk["model"], model)
+                            
+                            content = choices[0].get("delta", {}).get("content", "")
+                            if content:
+                                buf_append(content)
+                                append(content)
+                                if len(buf) >= STREAM_FLUSH_CHUNKS:
+                                    write("".join(buf))
+                                    flush()
+                                    buf.clear()
+                    # Never hold text back past the read that delivered it;
+                    # this also leaves buf empty if the next read fails
+                    if buf:
+                        write("".join(buf))
+                        flush()
+                        buf.clear()
+                    if done:
+                        break
+
+            full_response = "".join(full_response_parts)
+            console.print("\n")
+            return full_response, actual_model
+        else:
+            # Professional loading animation
+            with Status(
+                "[bold #a855f7]🤔 Processing your request...",
+                spinner="dots",
+                spinner_style=Theme.ACCENT_BLUE
+            ) as status:
+                response = await client.post(
+                    f"{endpoint}/v1/chat/completions",
+                    headers=headers,
+                    content=body
+                )
+
+            if response.status_code != 200:
+                error_panel = Panel(
+                    f"[bold red]✗ Server Error {response.status_code}[/bold red]\n\n"
+                    f"[dim]{response.text[:200]}[/dim]",
+                    title="[bold]Request Failed[/bold]",
+                    border_style=Theme.ERROR,
+                    padding=(1, 2)
+                )
+                console.print(error_panel)
+                return None, model
+
+            result = _json_loads(response.content)
+            content = result["choices"][0]["message"]["content"]
+            
+            # Extract actual model from response
+            actual_model = extract_actual_model(result.get("model", ""), model)
+
+            # Retro response display
+            console.print()
+            console.print(f"[{Theme.ACCENT_GREEN}]AI[/{Theme.ACCENT_GREEN}] [white]▸[/white] {content}")
+            console.print()
 
-                return content, actual_model
+            return content, actual_model
 
     except httpx.ConnectError:
         connection_panel = Panel(
@@ -1407,18 +1706,310 @@ async def send_message(message: str, model: str, conversation_history: list, str
         console.print()
         return None, model
 
+_USE_USAGE_PANEL = Panel(
+    "[bold yellow]⚠ Usage: /use <model-name>[/bold yellow]\n\n"
+    "[bold]Examples:[/bold]\n"
+    "• [#a855f7]/use gpt-4[/#a855f7]\n"
+    "• [#a855f7]/use gpt-3.5-turbo[/#a855f7]\n"
+    "• [#a855f7]/use gpt-4o[/#a855f7]\n\n"
+    "[dim]Use [bold #a855f7]/models[/bold #a855f7] to see all available models.[/dim]",
+    title="[bold]Usage Help[/bold]",
+    border_style=Theme.WARNING,
+    padding=(1, 2)
+)
+
+def _build_stream_panel(enabled: bool) -> Panel:
+    status_emoji = "✓" if enabled else "✗"
+    status_text = "enabled" if enabled else "disabled"
+    status_color = Theme.SUCCESS if enabled else Theme.WARNING
+    return Panel(
+        f"[bold {status_color}]{status_emoji} Streaming {status_text}[/bold {status_color}]\n\n"
+        f"[dim]Mode: {'Real-time responses' if enabled else 'Batch responses'}[/dim]",
+        title="[bold]Streaming Mode[/bold]",
+        border_style=status_color,
+        padding=(1, 2)
+    )
+
+# /stream only ever shows one of two panels
+_STREAM_PANELS = {True: _build_stream_panel(True), False: _build_stream_panel(False)}
+
+_RESET_PANEL = Panel(
+    "[bold green]✓ Reset complete![/bold green]\n\n"
+    "[dim]All settings, tokens, and API keys have been reset to defaults.[/dim]\n"
+    "[dim]You'll need to add new tokens with /token add[/dim]",
+    title="[bold]Complete Reset[/bold]",
+    border_style=Theme.SUCCESS,
+    padding=(1, 2)
+)
+
+_GOODBYE_PANEL = Panel(
+    "[bold white]Thanks for using Chat2API CLI![/bold white]\n\n"
+    "[dim]Professional AI Chat Interface • v2.0[/dim]\n"
+    "[dim]Made with ♥ by Kira[/dim]",
+    title="[bold]👋 Goodbye![/bold]",
+    border_style=Theme.PRIMARY,
+    padding=(1, 2),
+    title_align="center"
+)
+
+class ReplState:
+    """Mutable REPL state shared by the slash-command handlers"""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.model = config.get("default_model", "gpt-3.5-turbo")
+        self.stream = True
+        self.history = []
+        self._session = None
+
+    def session(self) -> tuple:
+        """(endpoint, active token, headers), resolved once until reset_session()"""
+        if self._session is None:
+            auth = config.get_active_token()
+            self._session = (config.endpoint, auth, build_auth_headers(auth) if auth else None)
+        return self._session
+
+    def reset_session(self):
+        """Re-read endpoint and token next time; any slash command may change them"""
+        self._session = None
+
+def handle_help(arg, state):
+    show_help()
+
+def handle_status(arg, state):
+    show_status(state.model, state.stream, state.history)
+
+def handle_models(arg, state):
+    list_models()
+
+def handle_use(arg, state):
+    if arg:
+        state.model = arg
+        
+        console.print(f"[dim]Verifying model '{state.model}'...[/dim]")
+        endpoint, auth, _ = state.session()
+        is_verified = state.loop.run_until_complete(verify_model(state.model, endpoint, auth))
+        
+        if is_verified:
+            model_panel = Panel(
+                f"[bold green]✓ Model switched and verified successfully![/bold green]\n\n"
+                f"[bold]Active Model:[/bold] [yellow]{state.model}[/yellow]\n"
+                f"[bold]Status:[/bold] [green]✓ Verified working[/green]\n"
+                f"[dim]This model will be used for all future conversations.[/dim]",
+                title="[bold]Model Changed & Verified[/bold]",
+                border_style=Theme.SUCCESS,
+                padding=(1, 2)
+            )
+        else:
+            model_panel = Panel(
+                f"[bold yellow]⚠ Model switched but verification failed![/bold yellow]\n\n"
+                f"[bold]Active Model:[/bold] [yellow]{state.model}[/yellow]\n"
+                f"[bold]Status:[/bold] [yellow]⚠ Could not verify[/yellow]\n"
+                f"[dim]The model name was changed, but we couldn't confirm it's actually working.[/dim]\n"
+                f"[dim]Try sending a message to test if it's working correctly.[/dim]",
+                title="[bold]Model Changed (Unverified)[/bold]",
+                border_style=Theme.WARNING,
+                padding=(1, 2)
+            )
+        
+        console.print(model_panel)
+        console.print()
+    else:
+        console.print(_USE_USAGE_PANEL)
+        console.print()
+
+def handle_stream(arg, state):
+    state.stream = not state.stream
+    console.print(_STREAM_PANELS[state.stream])
+    console.print()
+
+def handle_clear(arg, state):
+    state.history = []
+    # show_banner clears the screen itself via console.clear()
+    show_banner()
+    show_status(state.model, state.stream, state.history)
+
+def handle_web(arg, state):
+    open_web_interface()
+
+def handle_endpoint(arg, state):
+    if arg:
+        switch_endpoint(arg)
+    else:
+        current_endpoint = config.endpoint
+        usage_panel = Panel(
+            f"[bold yellow]⚠ Usage: /endpoint <url>[/bold yellow]\n\n"
+            f"[bold]Current Endpoint:[/bold] [yellow]{current_endpoint}[/yellow]\n\n"
+            f"[bold]Examples:[/bold]\n"
+            f"• [#a855f7]/endpoint http://localhost:5005[/#a855f7]\n"
+            f"• [#a855f7]/endpoint https://your-server.com[/#a855f7]\n"
+            f"• [#a855f7]/endpoint https://api.example.com:8080[/#a855f7]\n\n"
+            f"[dim]The endpoint will be tested before switching.[/dim]",
+            title="[bold]Endpoint Usage[/bold]",
+            border_style=Theme.WARNING,
+            padding=(1, 2)
+        )
+        console.print(usage_panel)
+        console.print()
+
+def handle_reset(arg, state):
+    if Confirm.ask(f"[{Theme.WARNING}]⚠ Reset all settings to defaults?[/{Theme.WARNING}]"):
+        state.history = []
+        state.model = "gpt-3.5-turbo"
+        state.stream = True
+        
+        config.tokens = {}
+        config.apikeys = {}
+        config.config['active_token'] = None
+        config.save_all()
+        
+        try:
+            DATA_DIR.mkdir(exist_ok=True)
+            (DATA_DIR / "token.txt").write_bytes(b"")
+        except Exception:
+            pass
+        
+        console.print(_RESET_PANEL)
+        console.print()
+
+def _run_subcommand(table: dict, name: str, arg: str, state):
+    """Split arg once into (subcommand, rest) and run the matching handler"""
+    parts = arg.split(None, 1)
+    sub = parts[0].lower()
+    handler = table.get(sub)
+    if handler:
+        handler(parts[1] if len(parts) > 1 else None, state)
+    else:
+        console.print(f"[bright_red]✗ Unknown {name} command: {sub}[/bright_red]")
+        console.print(f"[dim bright_white]💡 Type [#a855f7]/{name}[/#a855f7] to see available commands[/dim bright_white]")
+
+def handle_token_add(token_arg, state):
+    add_token_interactive()
+
+def handle_token_list(token_arg, state):
+    list_tokens()
+
+def handle_token_use(token_arg, state):
+    if token_arg:
+        if config.use_token(token_arg):
+            console.print(f"[bright_green]✓ Now using token '[bright_yellow]{token_arg}[/bright_yellow]'[/bright_green]")
+        else:
+            console.print(f"[bright_red]✗ Token '{token_arg}' not found![/bright_red]")
+            console.print("[dim bright_white]💡 Use [#a855f7]/token list[/#a855f7] to see available tokens[/dim bright_white]")
+    else:
+        console.print("[bright_yellow]⚠ Usage: /token use <name>[/bright_yellow]")
+
+def handle_token_remove(token_arg, state):
+    if token_arg:
+        if config.remove_token(token_arg):
+            console.print(f"[bright_green]✓ Token '{token_arg}' removed successfully[/bright_green]")
+        else:
+            console.print(f"[bright_red]✗ Token '{token_arg}' not found![/bright_red]")
+    else:
+        console.print("[bright_yellow]⚠ Usage: /token remove <name>[/bright_yellow]")
+
+TOKEN_COMMANDS = {
+    "add": handle_token_add,
+    "list": handle_token_list,
+    "use": handle_token_use,
+    "remove": handle_token_remove,
+}
+
+def handle_token(arg, state):
+    if not arg:
+        console.print()
+        console.print("[bright_yellow]🔑 Token Management Commands:[/bright_yellow]")
+        console.print("  [#a855f7]/token add[/#a855f7]             Add a new token")
+        console.print("  [#a855f7]/token list[/#a855f7]            List all tokens")
+        console.print("  [#a855f7]/token use <name>[/#a855f7]      Use a specific token")
+        console.print("  [#a855f7]/token remove <name>[/#a855f7]   Remove a token")
+        console.print()
+        return
+
+    _run_subcommand(TOKEN_COMMANDS, "token", arg, state)
+
+def handle_apikey_generate(apikey_arg, state):
+    generate_apikey_interactive()
+
+def handle_apikey_list(apikey_arg, state):
+    list_apikeys()
+
+def handle_apikey_test(apikey_arg, state):
+    if apikey_arg:
+        endpoint, _, _ = state.session()
+        state.loop.run_until_complete(test_apikey(apikey_arg, state.model, endpoint))
+    else:
+        console.print("[bright_yellow]⚠ Usage: /apikey test <name>[/bright_yellow]")
+        console.print("[dim bright_white]💡 Example: /apikey test my-app[/dim bright_white]")
+
+def handle_apikey_remove(apikey_arg, state):
+    if apikey_arg:
+        if config.remove_apikey(apikey_arg):
+            console.print(f"[bright_green]✓ API key '{apikey_arg}' removed successfully[/bright_green]")
+        else:
+            console.print(f"[bright_red]✗ API key '{apikey_arg}' not found![/bright_red]")
+    else:
+        console.print("[bright_yellow]⚠ Usage: /apikey remove <name>[/bright_yellow]")
+
+_APIKEY_GENERATE_ALIASES = frozenset({"generate", "gen", "add"})
+_APIKEY_LIST_ALIASES = frozenset({"list", "ls"})
+_APIKEY_REMOVE_ALIASES = frozenset({"remove", "rm", "delete"})
+
+APIKEY_COMMANDS = {
+    **dict.fromkeys(_APIKEY_GENERATE_ALIASES, handle_apikey_generate),
+    **dict.fromkeys(_APIKEY_LIST_ALIASES, handle_apikey_list),
+    "test": handle_apikey_test,
+    **dict.fromkeys(_APIKEY_REMOVE_ALIASES, handle_apikey_remove),
+}
+
+def handle_apikey(arg, state):
+    if not arg:
+        console.print()
+        console.print("[bright_yellow]🔐 API Key Generation Commands:[/bright_yellow]")
+        console.print("  [#a855f7]/apikey generate[/#a855f7]       Generate a new OpenAI-compatible API key")
+        console.print("  [#a855f7]/apikey list[/#a855f7]           List all generated API keys")
+        console.print("  [#a855f7]/apikey test <name>[/#a855f7]    Test a specific API key")
+        console.print("  [#a855f7]/apikey remove <name>[/#a855f7]  Remove an API key")
+        console.print()
+        console.print("[dim bright_white]💡 These API keys can be used in external programs like VS Code, Python, etc.[/dim bright_white]")
+        console.print()
+        return
+
+    _run_subcommand(APIKEY_COMMANDS, "apikey", arg, state)
+
+# Slash command -> handler(arg, state); COMMANDS above holds the descriptions
+SLASH_COMMANDS = {
+    "/help": handle_help,
+    "/status": handle_status,
+    "/models": handle_models,
+    "/use": handle_use,
+    "/stream": handle_stream,
+    "/clear": handle_clear,
+    "/web": handle_web,
+    "/endpoint": handle_endpoint,
+    "/reset": handle_reset,
+    "/token": handle_token,
+    "/apikey": handle_apikey,
+}
+
 def main():
     """Main CLI loop"""
+    import asyncio
+
+    # One event loop for the whole session keeps the pooled AsyncClient's
+    # connections alive between commands
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
     show_banner()
 
-    current_model = config.get("default_model", "gpt-3.5-turbo")
-    current_stream = True
-    conversation_history = []
+    state = ReplState(loop)
 
-    show_status(current_model, current_stream, conversation_history)
+    show_status(state.model, state.stream, state.history)
 
     while True:
         try:
+            print_sync_messages()
             user_input = get_user_input()
 
             if not user_input.strip():
@@ -1426,274 +2017,48 @@ def main():
 
             if user_input.lower() in ["exit", "/exit", "bye"]:
                 console.print()
-                goodbye_panel = Panel(
-                    "[bold white]Thanks for using Chat2API CLI![/bold white]\n\n"
-                    "[dim]Professional AI Chat Interface • v2.0[/dim]\n"
-                    "[dim]Made with ♥ by Kira[/dim]",
-                    title="[bold]👋 Goodbye![/bold]",
-                    border_style=Theme.PRIMARY,
-                    padding=(1, 2),
-                    title_align="center"
-                )
-                console.print(goodbye_panel)
+                console.print(_GOODBYE_PANEL)
                 console.print()
                 break
 
             if user_input.startswith("/"):
-                parts = user_input.split(maxsplit=1)
+                parts = user_input.split(None, 1)
                 command = parts[0].lower()
                 arg = parts[1] if len(parts) > 1 else None
 
-                if command == "/help":
-                    show_help()
-                    continue
-
-                elif command == "/status":
-                    show_status(current_model, current_stream, conversation_history)
-                    continue
-
-                elif command == "/models":
-                    list_models()
-                    continue
-
-                elif command == "/use":
-                    if arg:
-                        current_model = arg
-                        
-                        console.print(f"[dim]Verifying model '{current_model}'...[/dim]")
-                        is_verified = asyncio.run(verify_model(current_model))
-                        
-                        if is_verified:
-                            model_panel = Panel(
-                                f"[bold green]✓ Model switched and verified successfully![/bold green]\n\n"
-                                f"[bold]Active Model:[/bold] [yellow]{current_model}[/yellow]\n"
-                                f"[bold]Status:[/bold] [green]✓ Verified working[/green]\n"
-                                f"[dim]This model will be used for all future conversations.[/dim]",
-                                title="[bold]Model Changed & Verified[/bold]",
-                                border_style=Theme.SUCCESS,
-                                padding=(1, 2)
-                            )
-                        else:
-                            model_panel = Panel(
-                                f"[bold yellow]⚠ Model switched but verification failed![/bold yellow]\n\n"
-                                f"[bold]Active Model:[/bold] [yellow]{current_model}[/yellow]\n"
-                                f"[bold]Status:[/bold] [yellow]⚠ Could not verify[/yellow]\n"
-                                f"[dim]The model name was changed, but we couldn't confirm it's actually working.[/dim]\n"
-                                f"[dim]Try sending a message to test if it's working correctly.[/dim]",
-                                title="[bold]Model Changed (Unverified)[/bold]",
-                                border_style=Theme.WARNING,
-                                padding=(1, 2)
-                            )
-                        
-                        console.print(model_panel)
-                        console.print()
-                    else:
-                        usage_panel = Panel(
-                            "[bold yellow]⚠ Usage: /use <model-name>[/bold yellow]\n\n"
-                            "[bold]Examples:[/bold]\n"
-                            "• [#a855f7]/use gpt-4[/#a855f7]\n"
-                            "• [#a855f7]/use gpt-3.5-turbo[/#a855f7]\n"
-                            "• [#a855f7]/use gpt-4o[/#a855f7]\n\n"
-                            "[dim]Use [bold #a855f7]/models[/bold #a855f7] to see all available models.[/dim]",
-                            title="[bold]Usage Help[/bold]",
-                            border_style=Theme.WARNING,
-                            padding=(1, 2)
-                        )
-                        console.print(usage_panel)
-                        console.print()
-                    continue
-
-                elif command == "/stream":
-                    current_stream = not current_stream
-                    status_emoji = "✓" if current_stream else "✗"
-                    status_text = "enabled" if current_stream else "disabled"
-                    status_color = Theme.SUCCESS if current_stream else Theme.WARNING
-                    
-                    stream_panel = Panel(
-                        f"[bold {status_color}]{status_emoji} Streaming {status_text}[/bold {status_color}]\n\n"
-                        f"[dim]Mode: {'Real-time responses' if current_stream else 'Batch responses'}[/dim]",
-                        title="[bold]Streaming Mode[/bold]",
-                        border_style=status_color,
-                        padding=(1, 2)
-                    )
-                    console.print(stream_panel)
-                    console.print()
-                    continue
-
-                elif command == "/clear":
-                    conversation_history = []
-                    os.system('cls' if os.name == 'nt' else 'clear')
-                    show_banner()
-                    show_status(current_model, current_stream, conversation_history)
-                    continue
-
-                elif command == "/web":
-                    open_web_interface()
-                    continue
-
-                elif command == "/endpoint":
-                    if arg:
-                        switch_endpoint(arg)
-                    else:
-                        current_endpoint = config.get("api_endpoint", "http://localhost:5005")
-                        usage_panel = Panel(
-                            f"[bold yellow]⚠ Usage: /endpoint <url>[/bold yellow]\n\n"
-                            f"[bold]Current Endpoint:[/bold] [yellow]{current_endpoint}[/yellow]\n\n"
-                            f"[bold]Examples:[/bold]\n"
-                            f"• [#a855f7]/endpoint http://localhost:5005[/#a855f7]\n"
-                            f"• [#a855f7]/endpoint https://your-server.com[/#a855f7]\n"
-                            f"• [#a855f7]/endpoint https://api.example.com:8080[/#a855f7]\n\n"
-                            f"[dim]The endpoint will be tested before switching.[/dim]",
-                            title="[bold]Endpoint Usage[/bold]",
-                            border_style=Theme.WARNING,
-                            padding=(1, 2)
-                        )
-                        console.print(usage_panel)
-                        console.print()
-                    continue
-
-                elif command == "/reset":
-                    if Confirm.ask(f"[{Theme.WARNING}]⚠ Reset all settings to defaults?[/{Theme.WARNING}]"):
-                        conversation_history = []
-                        current_model = "gpt-3.5-turbo"
-                        current_stream = True
-                        
-                        config.tokens = {}
-                        config.apikeys = {}
-                        config.config['active_token'] = None
-                        config.save_tokens()
-                        config.save_apikeys()
-                        config.save_config()
-                        
-                        try:
-                            DATA_DIR.mkdir(exist_ok=True)
-                            token_file = DATA_DIR / "token.txt"
-                            with open(token_file, 'w') as f:
-                                pass
-                        except Exception:
-                            pass
-                        
-                        reset_panel = Panel(
-                            "[bold green]✓ Reset complete![/bold green]\n\n"
-                            "[dim]All settings, tokens, and API keys have been reset to defaults.[/dim]\n"
-                            "[dim]You'll need to add new tokens with /token add[/dim]",
-                            title="[bold]Complete Reset[/bold]",
-                            border_style=Theme.SUCCESS,
-                            padding=(1, 2)
-                        )
-                        console.print(reset_panel)
-                        console.print()
-                    continue
-
-
-                elif command == "/token":
-                    if not arg:
-                        console.print()
-                        console.print("[bright_yellow]🔑 Token Management Commands:[/bright_yellow]")
-                        console.print("  [#a855f7]/token add[/#a855f7]             Add a new token")
-                        console.print("  [#a855f7]/token list[/#a855f7]            List all tokens")
-                        console.print("  [#a855f7]/token use <name>[/#a855f7]      Use a specific token")
-                        console.print("  [#a855f7]/token remove <name>[/#a855f7]   Remove a token")
-                        console.print()
-                        continue
-
-                    token_parts = arg.split(maxsplit=1)
-                    token_cmd = token_parts[0].lower()
-                    token_arg = token_parts[1] if len(token_parts) > 1 else None
-
-                    if token_cmd == "add":
-                        add_token_interactive()
-
-                    elif token_cmd == "list":
-                        list_tokens()
-
-                    elif token_cmd == "use":
-                        if token_arg:
-                            if config.use_token(token_arg):
-                                console.print(f"[bright_green]✓ Now using token '[bright_yellow]{token_arg}[/bright_yellow]'[/bright_green]")
-                            else:
-                                console.print(f"[bright_red]✗ Token '{token_arg}' not found![/bright_red]")
-                                console.print("[dim bright_white]💡 Use [#a855f7]/token list[/#a855f7] to see available tokens[/dim bright_white]")
-                        else:
-                            console.print("[bright_yellow]⚠ Usage: /token use <name>[/bright_yellow]")
-
-                    elif token_cmd == "remove":
-                        if token_arg:
-                            if config.remove_token(token_arg):
-                                console.print(f"[bright_green]✓ Token '{token_arg}' removed successfully[/bright_green]")
-                            else:
-                                console.print(f"[bright_red]✗ Token '{token_arg}' not found![/bright_red]")
-                        else:
-                            console.print("[bright_yellow]⚠ Usage: /token remove <name>[/bright_yellow]")
-
-                    else:
-                        console.print(f"[bright_red]✗ Unknown token command: {token_cmd}[/bright_red]")
-                        console.print("[dim bright_white]💡 Type [#a855f7]/token[/#a855f7] to see available commands[/dim bright_white]")
-
-                    continue
-
-                elif command == "/apikey":
-                    if not arg:
-                        console.print()
-                        console.print("[bright_yellow]🔐 API Key Generation Commands:[/bright_yellow]")
-                        console.print("  [#a855f7]/apikey generate[/#a855f7]       Generate a new OpenAI-compatible API key")
-                        console.print("  [#a855f7]/apikey list[/#a855f7]           List all generated API keys")
-                        console.print("  [#a855f7]/apikey test <name>[/#a855f7]    Test a specific API key")
-                        console.print("  [#a855f7]/apikey remove <name>[/#a855f7]  Remove an API key")
-                        console.print()
-                        console.print("[dim bright_white]💡 These API keys can be used in external programs like VS Code, Python, etc.[/dim bright_white]")
-                        console.print()
-                        continue
-
-                    apikey_parts = arg.split(maxsplit=1)
-                    apikey_cmd = apikey_parts[0].lower()
-                    apikey_arg = apikey_parts[1] if len(apikey_parts) > 1 else None
-
-                    if apikey_cmd == "generate" or apikey_cmd == "gen" or apikey_cmd == "add":
-                        generate_apikey_interactive()
-
-                    elif apikey_cmd == "list" or apikey_cmd == "ls":
-                        list_apikeys()
-
-                    elif apikey_cmd == "test":
-                        if apikey_arg:
-                            asyncio.run(test_apikey(apikey_arg, current_model))
-                        else:
-                            console.print("[bright_yellow]⚠ Usage: /apikey test <name>[/bright_yellow]")
-                            console.print("[dim bright_white]💡 Example: /apikey test my-app[/dim bright_white]")
-
-                    elif apikey_cmd == "remove" or apikey_cmd == "rm" or apikey_cmd == "delete":
-                        if apikey_arg:
-                            if config.remove_apikey(apikey_arg):
-                                console.print(f"[bright_green]✓ API key '{apikey_arg}' removed successfully[/bright_green]")
-                            else:
-                                console.print(f"[bright_red]✗ API key '{apikey_arg}' not found![/bright_red]")
-                        else:
-                            console.print("[bright_yellow]⚠ Usage: /apikey remove <name>[/bright_yellow]")
-
-                    else:
-                        console.print(f"[bright_red]✗ Unknown apikey command: {apikey_cmd}[/bright_red]")
-                        console.print("[dim bright_white]💡 Type [#a855f7]/apikey[/#a855f7] to see available commands[/dim bright_white]")
-
-                    continue
-
+                handler = SLASH_COMMANDS.get(command)
+                if handler:
+                    try:
+                        handler(arg, state)
+                    finally:
+                        state.reset_session()
                 else:
                     console.print(f"[bright_red]✗ Unknown command: {command}[/bright_red]")
                     console.print("[dim bright_white]💡 Type [#a855f7]/help[/#a855f7] to see all available commands[/dim bright_white]")
-                    continue
+                continue
 
-            conversation_history.append({"role": "user", "content": user_input})
+            state.history.append({"role": "user", "content": user_input})
 
-            response, actual_model = asyncio.run(send_message(user_input, current_model, conversation_history, current_stream))
+            endpoint, auth, headers = state.session()
+
+            response, actual_model = loop.run_until_complete(send_message(user_input, state.model, state.history, state.stream, endpoint, auth, headers))
 
             if response:
-                conversation_history.append({"role": "assistant", "content": response})
-                if actual_model != current_model:
-                    current_model = actual_model
+                state.history.append({"role": "assistant", "content": response})
+                if actual_model != state.model:
+                    state.model = actual_model
                     console.print(f"[dim]{Theme.ACCENT_PURPLE}ℹ Model updated to: {actual_model}[/{Theme.ACCENT_PURPLE}][/dim]")
                     console.print()
 
         except KeyboardInterrupt:
+            # Ctrl-C leaves the interrupted request's task pending on the
+            # persistent loop, where it would resume inside the next
+            # run_until_complete; cancel and drain it as asyncio.run did
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
             console.print("\n[bright_yellow]⚠ Interrupted. Type [#a855f7]/exit[/#a855f7] to quit.[/bright_yellow]\n")
             continue
         except EOFError:
@@ -1707,5 +2072,8 @@ def main():
                 error_msg = error_msg.replace('[', '\\[').replace(']', '\\]')
                 console.print(f"\n[bright_red]✗ Error: {error_msg}[/bright_red]\n")
 
+    loop.run_until_complete(close_async_client())
+    loop.close()
+
 if __name__ == "__main__":
     main()
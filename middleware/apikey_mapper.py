@@ -3,101 +3,150 @@ API Key Mapping Middleware
 Intercepts all requests and maps sk-xxx API keys to ChatGPT tokens
 """
 import json
+import logging
+import threading
+import traceback
 from pathlib import Path
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.datastructures import MutableHeaders
 from utils.Logger import logger
 
+# utils.Logger wraps the root logger; level checks go through it directly
+_root_logger = logging.getLogger()
+
+_BEARER = b"Bearer "
+
 
 class APIKeyMapperMiddleware(BaseHTTPMiddleware):
     """Middleware to map API keys to ChatGPT tokens"""
+
+    apikeys_file = Path("auth/apikeys.json")
+    tokens_file = Path("auth/tokens.json")
+
+    # Parsed mapping files keyed by their st_mtime_ns, shared across instances
+    _cache = {"apikeys": (0, {}), "tokens": (0, {})}
+    _cache_lock = threading.Lock()
+    # sk-xxx key -> (resolved ChatGPT token, key name, token name), rebuilt
+    # whenever either mapping file is reloaded
+    _index = {}
+    _index_source = (None, None)
+
+    @classmethod
+    def _load_cached(cls, key: str, path: Path) -> dict:
+        """Return the parsed JSON for path, re-reading it only when its mtime changes"""
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = 0
+
+        cached_mtime, data = cls._cache[key]
+        if mtime == cached_mtime:
+            return data
+
+        with cls._cache_lock:
+            cached_mtime, data = cls._cache[key]
+            if mtime != cached_mtime:
+                data = {}
+                if mtime:
+                    with open(path, 'rb') as f:
+                        data = json.load(f)
+                cls._cache[key] = (mtime, data)
+            return data
     
-    def __init__(self, app):
-        super().__init__(app)
-        self.apikeys_file = Path("auth/apikeys.json")
-        self.tokens_file = Path("auth/tokens.json")
-    
-    def load_mappings(self):
+    @classmethod
+    def load_mappings(cls):
         """Load API key and token mappings"""
         try:
-            apikeys = {}
-            tokens = {}
-            
-            if self.apikeys_file.exists():
-                with open(self.apikeys_file, 'r') as f:
-                    apikeys = json.load(f)
-            
-            if self.tokens_file.exists():
-                with open(self.tokens_file, 'r') as f:
-                    tokens = json.load(f)
-            
+            apikeys = cls._load_cached("apikeys", cls.apikeys_file)
+            tokens = cls._load_cached("tokens", cls.tokens_file)
             return apikeys, tokens
         except Exception as e:
             logger.error(f"Error loading mappings: {e}")
             return {}, {}
+
+    @staticmethod
+    def _build_index(apikeys: dict, tokens: dict) -> dict:
+        """Resolve every API key to (token, key name, token name) in one pass"""
+        index = {}
+        first_token = next(iter(tokens.values()), None)
+        for name, data in apikeys.items():
+            if not isinstance(data, dict) or 'key' not in data:
+                continue
+            token_name = data.get('token_name', 'auto')
+            if token_name in tokens:
+                index.setdefault(data['key'], (tokens[token_name], name, token_name))
+            elif token_name == 'auto' and first_token is not None:
+                index.setdefault(data['key'], (first_token, name, token_name))
+        return index
+
+    @classmethod
+    def load_index(cls) -> dict:
+        """Return the API key index, rebuilding it if the mappings were reloaded"""
+        apikeys, tokens = cls.load_mappings()
+        source_apikeys, source_tokens = cls._index_source
+        if apikeys is not source_apikeys or tokens is not source_tokens:
+            cls._index = cls._build_index(apikeys, tokens)
+            cls._index_source = (apikeys, tokens)
+            logger.info(f"📁 Indexed {len(cls._index)} API keys from {len(apikeys)} API keys and {len(tokens)} tokens")
+        return cls._index
     
     def map_apikey_to_token(self, api_key: str) -> str:
         """Map sk-xxx API key to ChatGPT token"""
-        if not api_key or not api_key.startswith("sk-"):
-            return api_key
-        
+        # Only generated sk- keys are indexed, so anything else simply misses
         try:
-            apikeys, tokens = self.load_mappings()
-            
-            logger.info(f"🔑 Checking API key: {api_key[:15]}...")
-            logger.info(f"📁 Loaded {len(apikeys)} API keys and {len(tokens)} tokens")
-            
-            # Find the API key
-            for name, data in apikeys.items():
-                if isinstance(data, dict) and data.get('key') == api_key:
-                    token_name = data.get('token_name', 'auto')
-                    
-                    if token_name in tokens:
-                        logger.info(f"✅ Mapped API key '{name}' → token '{token_name}'")
-                        return tokens[token_name]
-                    elif token_name == 'auto' and tokens:
+            log_info = _root_logger.isEnabledFor(logging.INFO)
+            if log_info:
+                logger.info(f"🔑 Checking API key: {api_key[:15]}...")
+
+            entry = self.load_index().get(api_key)
+            if entry is not None:
+                token, name, token_name = entry
+                if log_info:
+                    if token_name == 'auto':
                         logger.info(f"✅ Mapped API key '{name}' → first available token")
-                        return list(tokens.values())[0]
+                    else:
+                        logger.info(f"✅ Mapped API key '{name}' → token '{token_name}'")
+                return token
             
             logger.warning(f"⚠️ API key not found in mapping: {api_key[:15]}...")
             return api_key
             
         except Exception as e:
             logger.error(f"❌ Error mapping API key: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            if _root_logger.isEnabledFor(logging.ERROR):
+                logger.error(traceback.format_exc())
             return api_key
     
     async def dispatch(self, request, call_next):
         """Intercept request and map API key if present"""
         
-        # Check for Authorization header
-        auth_header = request.headers.get("authorization", "")
+        # Fast path: find the raw Authorization header (ASGI header names are
+        # lowercase) and bail out unless it carries an sk- key
+        headers = request.scope["headers"]
+        for auth_index, (name, value) in enumerate(headers):
+            if name == b"authorization":
+                break
+        else:
+            return await call_next(request)
+
+        if not value.startswith(b"Bearer sk-"):
+            return await call_next(request)
+
+        original_token = value[len(_BEARER):].decode("latin-1")  # Remove "Bearer "
+        log_info = _root_logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(f"🔍 Detected API key in request")
+        
+        # Map the API key to ChatGPT token
+        mapped_token = self.map_apikey_to_token(original_token)
         
-        if auth_header.startswith("Bearer "):
-            original_token = auth_header[7:]  # Remove "Bearer "
+        if mapped_token != original_token:
+            if log_info:
+                logger.info(f"🔄 Replacing API key with ChatGPT token")
             
-            if original_token.startswith("sk-"):
-                logger.info(f"🔍 Detected API key in request")
-                
-                # Map the API key to ChatGPT token
-                mapped_token = self.map_apikey_to_token(original_token)
-                
-                if mapped_token != original_token:
-                    logger.info(f"🔄 Replacing API key with ChatGPT token")
-                    
-                    # Update the authorization header in the request scope
-                    # request.scope["headers"] is a list of tuples: [(b"header-name", b"value"), ...]
-                    new_headers = []
-                    for name, value in request.scope["headers"]:
-                        if name.lower() == b"authorization":
-                            # Replace with mapped token
-                            new_headers.append((name, f"Bearer {mapped_token}".encode()))
-                        else:
-                            new_headers.append((name, value))
-                    
-                    # Update the scope
-                    request.scope["headers"] = new_headers
+            # Replace the authorization header in place in the request scope
+            # request.scope["headers"] is a list of tuples: [(b"header-name", b"value"), ...]
+            headers[auth_index] = (name, _BEARER + mapped_token.encode())
         
         # Continue with the request
         response = await call_next(request)